@@ -1,19 +1,47 @@
 from __future__ import annotations
 
 from pathlib import Path
-import json
+import os
 import re
-import tomllib
-import urllib.request
+import sys
+import time
+from typing import TYPE_CHECKING
 
 from textual.app import App
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, Footer, Header, Input, ListItem, ListView, Static
-
-from toolbox.registry import ToolRegistry
-from toolbox.tools.settings import SettingsScreen
+from textual.timer import Timer
+from textual.widgets import (
+    Button,
+    Footer,
+    Header,
+    Input,
+    ListItem,
+    ListView,
+    OptionList,
+    Static,
+)
+
+from toolbox.registry import AnyTool, ToolRegistry, ToolStub
+
+if TYPE_CHECKING:
+    import http.client
+
+_VERSION_SPLIT_RE = re.compile(r"[.+-]")
+_UPDATE_CACHE_PATH = Path.home() / ".cache" / "toolbox" / "update.json"
+_UPDATE_CACHE_TTL = 6 * 60 * 60
+_SEARCH_DEBOUNCE = 0.05
+_REMOTE_HOST = "raw.githubusercontent.com"
+
+
+def _version_tuple(value: str) -> tuple[int, ...]:
+    nums: list[int] = []
+    for part in _VERSION_SPLIT_RE.split(value):
+        if not part.isdigit():
+            break
+        nums.append(int(part))
+    return tuple(nums)
 
 
 class ToolScreen(Screen):
@@ -41,13 +69,21 @@ class ToolboxApp(App):
         ("q", "quit", "Quit"),
         ("s", "open_settings", "Settings"),
     ]
+    _http_connection: "http.client.HTTPSConnection | None" = None
 
     def __init__(self, registry: ToolRegistry | None = None) -> None:
         super().__init__()
         self._tool_registry = registry or ToolRegistry.discover()
         self._filtered_tools = list(self._tool_registry.tools)
-        self._categories: list[str] = []
+        self._by_category = self._index_categories(self._tool_registry.tools)
+        self._by_char = {
+            category: self._index_characters(tools)
+            for category, tools in self._by_category.items()
+        }
+        self._categories: tuple[str, ...] = ()
         self._selected_category = "All"
+        self._search_timer: Timer | None = None
+        self._rendered_filter: tuple[str, str] | None = None
 
     def compose(self):
         yield Header()
@@ -60,7 +96,7 @@ class ToolboxApp(App):
                 yield Static("Categories", id="category-title")
                 self.category_list = ListView(id="category-list")
                 yield self.category_list
-                self.tool_list = ListView(id="tool-list")
+                self.tool_list = OptionList(id="tool-list")
                 yield self.tool_list
             with Vertical(id="content"):
                 yield Static("Select a tool to view details.", id="content-title")
@@ -78,7 +114,13 @@ class ToolboxApp(App):
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "tool-search":
-            self._refresh_tool_list(event.value)
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(_SEARCH_DEBOUNCE, self._apply_search)
+
+    def _apply_search(self) -> None:
+        self._search_timer = None
+        self._refresh_tool_list(self.search_input.value)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.list_view.index is None:
@@ -87,9 +129,6 @@ class ToolboxApp(App):
             self._selected_category = self._categories[event.list_view.index]
             self._refresh_tool_list(self.search_input.value)
             self.tool_list.focus()
-            return
-        tool = self._filtered_tools[event.list_view.index]
-        self.open_tool(tool)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         if event.list_view.index is None:
@@ -97,8 +136,16 @@ class ToolboxApp(App):
         if event.list_view.id == "category-list":
             self._selected_category = self._categories[event.list_view.index]
             self._refresh_tool_list(self.search_input.value)
-            return
-        self._show_tool(event.list_view.index)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        if event.option_list.id == "tool-list":
+            self.open_tool(self._filtered_tools[event.option_index])
+
+    def on_option_list_option_highlighted(
+        self, event: OptionList.OptionHighlighted
+    ) -> None:
+        if event.option_list.id == "tool-list":
+            self._show_tool(event.option_index)
 
     def _show_tool(self, index: int) -> None:
         tool = self._filtered_tools[index]
@@ -110,6 +157,9 @@ class ToolboxApp(App):
         )
 
     def open_tool(self, tool) -> None:
+        if isinstance(tool, ToolStub):
+            # has_screen is only read from the source; the loaded tool decides.
+            tool = tool.load()
         if tool.screen_factory is None:
             self.push_screen(ToolScreen(tool.name, tool.description))
             return
@@ -122,25 +172,33 @@ class ToolboxApp(App):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "open-settings":
-            self.push_screen(SettingsScreen())
+            self.action_open_settings()
 
     def action_open_settings(self) -> None:
+        from toolbox.tools.settings import SettingsScreen
+
         self.push_screen(SettingsScreen())
 
     def _refresh_tool_list(self, query: str) -> None:
         needle = query.strip().lower()
         category = self._selected_category
-        self._filtered_tools = [
-            tool
-            for tool in self._tool_registry.tools
-            if (needle in tool.name.lower() if needle else True)
-            and (category == "All" or tool.category == category)
-        ]
-        self.tool_list.clear()
-        for tool in self._filtered_tools:
-            self.tool_list.append(ListItem(Static(tool.name)))
+        if (category, needle) == self._rendered_filter:
+            return
+        self._rendered_filter = (category, needle)
+        if not needle:
+            self._filtered_tools = list(self._by_category.get(category, ()))
+        elif len(needle) == 1:
+            self._filtered_tools = list(self._by_char.get(category, {}).get(needle, ()))
+        else:
+            self._filtered_tools = [
+                tool
+                for tool in self._by_category.get(category, ())
+                if needle in tool.name_lower
+            ]
+        self.tool_list.clear_options()
+        self.tool_list.add_options([tool.name for tool in self._filtered_tools])
         if self._filtered_tools:
-            self.tool_list.index = 0
+            self.tool_list.highlighted = 0
             self._show_tool(0)
         else:
             self.tool_details.update("No tools match your search.")
@@ -149,7 +207,7 @@ class ToolboxApp(App):
         repo_root = Path(__file__).resolve().parents[2]
         local_version = self._read_local_version(repo_root)
         branch = self._read_update_branch(repo_root)
-        remote_version = self._fetch_remote_version(branch)
+        remote_version = self._cached_remote_version(branch)
         if local_version is None or remote_version is None:
             return
         if self._compare_versions(local_version, remote_version) < 0:
@@ -165,51 +223,109 @@ class ToolboxApp(App):
         text = pyproject.read_text(encoding="utf-8")
         return self._parse_version_toml(text)
 
-    def _fetch_remote_version(self, branch: str) -> str | None:
-        url = f"https://raw.githubusercontent.com/clevrthings/Toolbox/{branch}/pyproject.toml"
+    def _fetch_remote_version(
+        self, branch: str, cached: dict | None = None
+    ) -> tuple[str | None, str | None]:
+        import gzip
+
+        cached = cached or {}
+        headers = {"User-Agent": "Toolbox-Updater", "Accept-Encoding": "gzip"}
+        if cached.get("etag") and cached.get("remote"):
+            headers["If-None-Match"] = cached["etag"]
+        connection = self._remote_connection()
         try:
-            request = urllib.request.Request(
-                url,
-                headers={"User-Agent": "Toolbox-Updater"},
+            connection.request(
+                "GET",
+                f"/clevrthings/Toolbox/{branch}/pyproject.toml",
+                headers=headers,
             )
-            with urllib.request.urlopen(request, timeout=6) as response:
-                text = response.read().decode("utf-8")
-                status = getattr(response, "status", 200)
+            response = connection.getresponse()
+            body = response.read()
+            if response.status == 304:
+                return str(cached["remote"]), cached["etag"]
+            if response.status != 200:
+                return None, None
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            text = body.decode("utf-8")
         except Exception:
-            return None
-        if status != 200:
-            return None
-        return self._parse_version_toml(text)
+            connection.close()
+            return None, None
+        return self._parse_version_toml(text), response.getheader("ETag")
+
+    @classmethod
+    def _remote_connection(cls) -> "http.client.HTTPSConnection":
+        import http.client
+
+        if cls._http_connection is None:
+            cls._http_connection = http.client.HTTPSConnection(_REMOTE_HOST, timeout=6)
+        return cls._http_connection
+
+    def _cached_remote_version(self, branch: str) -> str | None:
+        cache = self._read_update_cache()
+        entry = cache.get(branch)
+        if not isinstance(entry, dict):
+            entry = {}
+        remote = entry.get("remote")
+        checked_at = entry.get("ts", 0)
+        if remote and time.time() - checked_at < _UPDATE_CACHE_TTL:
+            return str(remote)
+        remote_version, etag = self._fetch_remote_version(branch, entry)
+        if remote_version is not None:
+            cache[branch] = {"remote": remote_version, "etag": etag, "ts": time.time()}
+            self._write_update_cache(cache)
+        return remote_version
+
+    def _read_update_cache(self) -> dict:
+        import json
 
-    def _compare_versions(self, local: str, remote: str) -> int:
-        def _parse(value: str) -> tuple[int, ...]:
-            parts = re.split(r"[.+-]", value)
-            nums: list[int] = []
-            for part in parts:
-                if part.isdigit():
-                    nums.append(int(part))
-                else:
-                    break
-            return tuple(nums)
-
-        local_tuple = _parse(local)
-        remote_tuple = _parse(remote)
-        if local_tuple == remote_tuple:
-            return 0
-        if local_tuple > remote_tuple:
-            return 1
-        return -1
+        try:
+            data = json.loads(_UPDATE_CACHE_PATH.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
 
-    def _parse_version_toml(self, text: str) -> str | None:
+    def _write_update_cache(self, data: dict) -> None:
+        import json
+
+        tmp_path = _UPDATE_CACHE_PATH.with_suffix(".tmp")
         try:
-            data = tomllib.loads(text)
+            _UPDATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, _UPDATE_CACHE_PATH)
         except Exception:
-            return None
-        project = data.get("project") if isinstance(data, dict) else None
-        version = project.get("version") if isinstance(project, dict) else None
-        return str(version) if version else None
+            pass
+
+    def _compare_versions(self, local: str, remote: str) -> int:
+        local_tuple = _version_tuple(local)
+        remote_tuple = _version_tuple(remote)
+        return (local_tuple > remote_tuple) - (local_tuple < remote_tuple)
+
+    def _parse_version_toml(self, text: str) -> str | None:
+        in_project = False
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("["):
+                in_project = stripped == "[project]"
+                continue
+            if not in_project or not stripped.startswith("version"):
+                continue
+            key, sep, value = stripped.partition("=")
+            if not sep or key.strip() != "version":
+                continue
+            value = value.strip()
+            quote = value[:1]
+            if quote not in {'"', "'"}:
+                return None
+            parts = value.split(quote, 2)
+            if len(parts) < 3 or not parts[1]:
+                return None
+            return parts[1]
+        return None
 
     def _read_update_branch(self, repo_root: Path) -> str:
+        import json
+
         config_path = repo_root / ".toolbox_config.json"
         if not config_path.exists():
             return "main"
@@ -220,12 +336,28 @@ class ToolboxApp(App):
         branch = data.get("update_branch")
         return branch if branch in {"main", "dev"} else "main"
 
+    @staticmethod
+    def _index_categories(tools: tuple[AnyTool, ...]) -> dict[str, tuple[AnyTool, ...]]:
+        buckets: dict[str, list[AnyTool]] = {}
+        for tool in tools:
+            buckets.setdefault(tool.category, []).append(tool)
+        index = {category: tuple(items) for category, items in buckets.items()}
+        index["All"] = tuple(tools)
+        return index
+
+    @staticmethod
+    def _index_characters(tools: tuple[AnyTool, ...]) -> dict[str, tuple[AnyTool, ...]]:
+        buckets: dict[str, list[AnyTool]] = {}
+        for tool in tools:
+            for char in dict.fromkeys(tool.name_lower):
+                buckets.setdefault(char, []).append(tool)
+        return {char: tuple(items) for char, items in buckets.items()}
+
     def _populate_categories(self) -> None:
         categories = sorted({tool.category for tool in self._tool_registry.tools})
-        self._categories = ["All", *categories]
+        self._categories = tuple(sys.intern(category) for category in ("All", *categories))
         self.category_list.clear()
-        for category in self._categories:
-            self.category_list.append(ListItem(Static(category)))
+        self.category_list.extend(ListItem(Static(category)) for category in self._categories)
         if self._categories:
             self.category_list.index = 0
             self._selected_category = self._categories[0]
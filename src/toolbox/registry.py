@@ -1,26 +1,142 @@
 from __future__ import annotations
 
+import ast
 import importlib
+import importlib.util
 import pkgutil
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from textual.screen import Screen
 
 import toolbox.tools
 from toolbox.tools.base import Tool
 
+ENTRY_POINT_GROUP = "toolbox.tools"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolStub:
+    name: str
+    description: str
+    category: str
+    module_name: str
+    has_screen: bool = True
+    attr: str = "TOOL"
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "name_lower", self.name.lower())
+
+    @property
+    def screen_factory(self) -> Optional[Callable[[], Screen]]:
+        return self._open_screen if self.has_screen else None
+
+    def load(self) -> Tool:
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.attr)
+
+    def _open_screen(self) -> Screen:
+        factory = self.load().screen_factory
+        if factory is None:
+            raise RuntimeError(f"{self.name} has no screen.")
+        return factory()
+
+
+AnyTool = Union[Tool, ToolStub]
+
+
+class _NotLiteral(Exception):
+    pass
+
+
+def _read_stub(module_name: str, attr: str = "TOOL") -> ToolStub:
+    if not attr.isidentifier():
+        raise _NotLiteral(module_name)
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        raise _NotLiteral(module_name)
+    try:
+        tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError) as exc:
+        raise _NotLiteral(module_name) from exc
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if not any(isinstance(t, ast.Name) and t.id == attr for t in targets):
+            continue
+        if not isinstance(node.value, ast.Call) or node.value.args:
+            raise _NotLiteral(module_name)
+        fields = {kw.arg: kw.value for kw in node.value.keywords}
+        try:
+            name, description, category = (
+                ast.literal_eval(fields[key]) for key in ("name", "description", "category")
+            )
+        except (KeyError, ValueError) as exc:
+            raise _NotLiteral(module_name) from exc
+        screen = fields.get("screen_factory")
+        has_screen = screen is not None and not (
+            isinstance(screen, ast.Constant) and screen.value is None
+        )
+        return ToolStub(name, description, category, module_name, has_screen, attr)
+    # The tool may be bound some other way (import, loop, setattr); let the caller import it.
+    raise _NotLiteral(module_name)
+
 
 @dataclass(frozen=True)
 class ToolRegistry:
-    tools: tuple[Tool, ...]
+    tools: tuple[AnyTool, ...]
 
     @classmethod
     def discover(cls) -> "ToolRegistry":
-        tools: list[Tool] = []
-        for module_info in pkgutil.iter_modules(toolbox.tools.__path__):
-            if module_info.name.startswith("_") or module_info.name == "base":
+        tools = cls._from_entry_points() or cls._from_package()
+        tools.sort(key=attrgetter("name_lower"))
+        return cls(tools=tuple(tools))
+
+    @staticmethod
+    def _from_entry_points() -> list[AnyTool]:
+        tools: list[AnyTool] = []
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            # "pkg.mod:NAME" names the tool; a bare "pkg.mod" falls back to TOOL.
+            attr = entry_point.attr or "TOOL"
+            try:
+                tools.append(_read_stub(entry_point.module, attr))
+                continue
+            except _NotLiteral:
+                pass
+            except Exception:
+                continue
+            try:
+                tool = importlib.import_module(entry_point.module)
+                for part in attr.split("."):
+                    tool = getattr(tool, part)
+            except Exception:
                 continue
-            module = importlib.import_module(f"toolbox.tools.{module_info.name}")
-            tool = getattr(module, "TOOL", None)
             if isinstance(tool, Tool):
                 tools.append(tool)
-        tools.sort(key=lambda t: t.name.lower())
-        return cls(tools=tuple(tools))
+        return tools
+
+    @staticmethod
+    def _from_package() -> list[AnyTool]:
+        tools: list[AnyTool] = []
+        for module_info in pkgutil.iter_modules(toolbox.tools.__path__):
+            if module_info.name.startswith("_") or module_info.name == "base":
+                continue
+            module_name = f"toolbox.tools.{module_info.name}"
+            try:
+                tools.append(_read_stub(module_name))
+            except _NotLiteral:
+                module = importlib.import_module(module_name)
+                tool = getattr(module, "TOOL", None)
+                if isinstance(tool, Tool):
+                    tools.append(tool)
+        return tools
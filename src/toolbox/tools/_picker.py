@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import DirectoryTree, Footer, Header, Static
+
+
+class FilteredDirectoryTree(DirectoryTree):
+    def filter_paths(self, paths):
+        return [path for path in paths if not path.name.startswith(".")]
+
+
+class DirectoryOnlyTree(FilteredDirectoryTree):
+    def filter_paths(self, paths):
+        paths = super().filter_paths(paths)
+        # One scandir per parent answers is_dir from the dirent instead of a stat per path.
+        dirs: set[Path] = set()
+        for parent in {path.parent for path in paths}:
+            try:
+                with os.scandir(parent) as entries:
+                    dirs.update(parent / entry.name for entry in entries if entry.is_dir())
+            except OSError:
+                dirs.update(path for path in paths if path.parent == parent and path.is_dir())
+        return [path for path in paths if path in dirs]
+
+
+class FolderPickerScreen(Screen):
+    BINDINGS = [Binding("escape", "back", "Cancel", priority=True)]
+
+    def __init__(
+        self,
+        *,
+        on_selected,
+        start_path: Path | None = None,
+        title: str = "Select folder",
+    ) -> None:
+        super().__init__()
+        self._on_selected = on_selected
+        self._start_path = start_path or Path.home()
+        self._title = title
+
+    def compose(self):
+        yield Header()
+        yield Static(self._title, id="folder-picker-title")
+        yield DirectoryOnlyTree(self._start_path, id="folder-picker-tree")
+        yield Footer()
+
+    def on_directory_tree_directory_selected(
+        self, event: DirectoryTree.DirectorySelected
+    ) -> None:
+        self._on_selected(event.path)
+        self.app.pop_screen()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+import os
 import shutil
-import importlib.util
 import subprocess
-import sys
-from typing import Callable
+import time
+from typing import Callable, Iterator
 
+from rich.markup import escape
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.screen import Screen
@@ -22,12 +25,36 @@ from textual.widgets import (
     Static,
 )
 
+from toolbox.tools._picker import FilteredDirectoryTree
 from toolbox.tools.base import Tool
 
 
-class FilteredDirectoryTree(DirectoryTree):
-    def filter_paths(self, paths):
-        return [path for path in paths if not path.name.startswith(".")]
+_PIPE_BUFSIZE = 1024 * 1024
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path() -> str | None:
+    return shutil.which("ffmpeg")
+
+
+def _convert_one(
+    source_file: Path,
+    out_file: Path,
+    input_args: list[str],
+    export_format: str,
+    export_args: list[str],
+    sample_rate: int | None,
+) -> None:
+    cmd = [_ffmpeg_path() or "ffmpeg", "-hide_banner", "-loglevel", "error", "-y"]
+    cmd += [*input_args, "-i", str(source_file), "-vn"]
+    if sample_rate is not None:
+        cmd += ["-ar", str(sample_rate)]
+    cmd += [*export_args, "-f", export_format, str(out_file)]
+    result = subprocess.run(cmd, capture_output=True, text=True, bufsize=_PIPE_BUFSIZE)
+    if result.returncode != 0:
+        lines = [line for line in result.stderr.splitlines() if line.strip()]
+        raise RuntimeError(lines[-1] if lines else "ffmpeg failed.")
 
 
 class PathPickerScreen(Screen):
@@ -82,7 +109,14 @@ class AudioConverterScreen(Screen):
         ("OPUS", "opus"),
         ("M4A (AAC)", "m4a"),
     ]
-    _LOSSY_FORMATS = {"mp3", "ogg", "opus", "m4a"}
+    _LOSSY_FORMATS = frozenset({"mp3", "ogg", "opus", "m4a"})
+    _EXPORT_FORMATS = {"m4a": "ipod"}
+    _COPY_ARGS = ["-c:a", "copy"]
+    _REPORT_INTERVAL = 0.1
+    _CODEC_ARGS = {
+        "opus": ["-c:a", "libopus", "-vbr", "on"],
+        "m4a": ["-c:a", "aac"],
+    }
     _INPUT_EXTS = {
         ".wav",
         ".mp3",
@@ -136,6 +170,12 @@ class AudioConverterScreen(Screen):
                 id="audio-sample-rate",
             )
             yield self.sample_rate_input
+            yield Label("Parallel jobs")
+            self.jobs_input = Input(
+                value=str(os.cpu_count() or 1),
+                id="audio-jobs",
+            )
+            yield self.jobs_input
             with Horizontal(id="audio-actions"):
                 yield Button("Start", id="audio-start", variant="success")
                 yield Button("Clear", id="audio-clear")
@@ -155,6 +195,7 @@ class AudioConverterScreen(Screen):
             self.source_input.value = ""
             self.target_input.value = ""
             self.sample_rate_input.value = ""
+            self.jobs_input.value = str(os.cpu_count() or 1)
             self.format_select.value = "mp3"
             self.bitrate_select.value = "192k"
             self._refresh_format_options()
@@ -178,13 +219,9 @@ class AudioConverterScreen(Screen):
         self._refresh_format_options()
 
     def _start_conversion(self) -> None:
-        if not self._pydub_installed():
-            self._prompt_pydub_install()
-            return
-        if not self._audioop_available():
-            self._prompt_audioop_install()
-            return
-        if shutil.which("ffmpeg") is None:
+        if _ffmpeg_path() is None:
+            # Don't remember a miss; ffmpeg may be installed outside the app.
+            _ffmpeg_path.cache_clear()
             self._prompt_ffmpeg_install()
             return
         try:
@@ -198,78 +235,16 @@ class AudioConverterScreen(Screen):
         sample_rate, ok = self._parse_sample_rate()
         if not ok:
             return
+        jobs = self._parse_jobs()
+        if jobs is None:
+            return
         self.status.update("Starting conversion...")
         self.progress.update(progress=0, total=0)
         self.run_worker(
-            lambda: self._convert_worker(source, target, fmt, bitrate, sample_rate),
+            lambda: self._convert_worker(source, target, fmt, bitrate, sample_rate, jobs),
             thread=True,
         )
 
-    def _pydub_installed(self) -> bool:
-        return importlib.util.find_spec("pydub") is not None
-
-    def _audioop_available(self) -> bool:
-        return (
-            importlib.util.find_spec("audioop") is not None
-            or importlib.util.find_spec("pyaudioop") is not None
-        )
-
-    def _prompt_pydub_install(self) -> None:
-        self.status.update(
-            "[yellow]pydub is required. Select Install to add it.[/yellow]"
-        )
-
-        def _start_install() -> None:
-            self.status.update("Installing pydub...")
-            self.run_worker(self._install_pydub_worker, thread=True)
-
-        self.app.push_screen(PydubPromptScreen(on_install=_start_install))
-
-    def _install_pydub_worker(self) -> None:
-        root = Path(__file__).resolve().parents[3]
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-e", str(root)],
-            capture_output=True,
-            text=True,
-            cwd=str(root),
-        )
-        if result.returncode == 0:
-            self.app.call_from_thread(
-                self.status.update,
-                "[green]pydub installed. Press Start to run conversion.[/green]",
-            )
-            return
-
-        message = result.stderr.strip() or result.stdout.strip() or "Installation failed."
-        self.app.call_from_thread(self.status.update, f"[red]{message}[/red]")
-
-    def _prompt_audioop_install(self) -> None:
-        self.status.update(
-            "[yellow]audioop is required for pydub on Python 3.14. Select Install to add it.[/yellow]"
-        )
-
-        def _start_install() -> None:
-            self.status.update("Installing audioop-lts...")
-            self.run_worker(self._install_audioop_worker, thread=True)
-
-        self.app.push_screen(AudioopPromptScreen(on_install=_start_install))
-
-    def _install_audioop_worker(self) -> None:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "audioop-lts"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            self.app.call_from_thread(
-                self.status.update,
-                "[green]audioop-lts installed. Press Start to run conversion.[/green]",
-            )
-            return
-
-        message = result.stderr.strip() or result.stdout.strip() or "Installation failed."
-        self.app.call_from_thread(self.status.update, f"[red]{message}[/red]")
-
     def _prompt_ffmpeg_install(self) -> None:
         self.status.update(
             "[yellow]ffmpeg is required. Select Install to download it.[/yellow]"
@@ -282,7 +257,7 @@ class AudioConverterScreen(Screen):
         self.app.push_screen(FFmpegPromptScreen(on_install=_start_install))
 
     def _install_ffmpeg_worker(self) -> None:
-        script = Path(__file__).resolve().parents[3] / "scripts" / "install_ffmpeg_macos.sh"
+        script = _PROJECT_ROOT / "scripts" / "install_ffmpeg_macos.sh"
         if not script.exists():
             self.app.call_from_thread(
                 self.status.update,
@@ -290,19 +265,33 @@ class AudioConverterScreen(Screen):
             )
             return
 
-        result = subprocess.run(
+        process = subprocess.Popen(
             ["bash", str(script)],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            bufsize=1,
         )
-        if result.returncode == 0:
+        last_line = ""
+        last_report = 0.0
+        for raw_line in process.stdout:
+            line = raw_line.strip()
+            if not line:
+                continue
+            last_line = line
+            now = time.monotonic()
+            if now - last_report >= self._REPORT_INTERVAL:
+                last_report = now
+                self.app.call_from_thread(self.status.update, escape(line))
+        if process.wait() == 0:
+            _ffmpeg_path.cache_clear()
             self.app.call_from_thread(
                 self.status.update,
                 "[green]ffmpeg installed. Press Start to run conversion.[/green]",
             )
             return
 
-        message = result.stderr.strip() or result.stdout.strip() or "Installation failed."
+        message = escape(last_line) or "Installation failed."
         self.app.call_from_thread(self.status.update, f"[red]{message}[/red]")
 
     def _open_picker(self, *, mode: str, target: str) -> None:
@@ -360,22 +349,14 @@ class AudioConverterScreen(Screen):
         output_fmt: str,
         bitrate: str,
         sample_rate: int | None,
+        jobs: int,
     ) -> None:
-        if shutil.which("ffmpeg") is None:
+        if _ffmpeg_path() is None:
             self.app.call_from_thread(
                 self.status.update,
                 "[red]ffmpeg is still missing. Install it and try again.[/red]",
             )
             return
-        try:
-            from pydub import AudioSegment
-        except ImportError:
-            self.app.call_from_thread(
-                self.status.update,
-                "[red]pydub failed to import. Install audioop-lts and try again.[/red]",
-            )
-            return
-
         files = self._collect_files(source)
         if not files:
             self.app.call_from_thread(
@@ -388,24 +369,35 @@ class AudioConverterScreen(Screen):
         total = len(files)
         self.app.call_from_thread(self.progress.update, progress=0, total=total)
 
+        input_args = self._input_args()
         export_format = self._export_format(output_fmt)
         export_args = self._export_args(output_fmt, bitrate)
-
+        # Split the cores between parallel jobs so ffmpeg's own threads don't oversubscribe.
+        threads = max(1, (os.cpu_count() or 1) // min(jobs, total))
+        export_args = [*export_args, "-threads", str(threads)]
+
+        conversions = self._run_conversions(
+            files,
+            target,
+            output_fmt,
+            input_args,
+            export_format,
+            export_args,
+            sample_rate,
+            jobs,
+        )
         errors: list[str] = []
-        for index, wav_file in enumerate(files, start=1):
-            try:
-                out_file = target / f"{wav_file.stem}.{output_fmt}"
-                audio = AudioSegment.from_file(wav_file)
-                if sample_rate is not None:
-                    audio = audio.set_frame_rate(sample_rate)
-                audio.export(out_file, format=export_format, **export_args)
-                self.app.call_from_thread(
-                    self.status.update,
-                    f"Converted {wav_file.name}",
-                )
-            except Exception as exc:
-                errors.append(f"{wav_file.name}: {exc}")
-            self.app.call_from_thread(self.progress.update, progress=index, total=total)
+        last_report = 0.0
+        for index, (wav_file, error) in enumerate(conversions, start=1):
+            if error is None:
+                message = f"Converted {wav_file.name}"
+            else:
+                message = f"Failed {wav_file.name}"
+                errors.append(f"{wav_file.name}: {error}")
+            now = time.monotonic()
+            if index == total or now - last_report >= self._REPORT_INTERVAL:
+                last_report = now
+                self.app.call_from_thread(self._report_progress, message, index, total)
 
         if errors:
             self.app.call_from_thread(
@@ -418,25 +410,89 @@ class AudioConverterScreen(Screen):
                 "[green]Conversion completed.[/green]",
             )
 
+    def _run_conversions(
+        self,
+        files: list[Path],
+        target: Path,
+        output_fmt: str,
+        input_args: list[str],
+        export_format: str,
+        export_args: list[str],
+        sample_rate: int | None,
+        jobs: int,
+    ) -> Iterator[tuple[Path, BaseException | None]]:
+        suffix = f".{output_fmt}"
+        # Same lossless format and rate: remux the existing stream instead of
+        # re-encoding it. Lossy targets always re-encode to honour the bitrate.
+        can_copy = sample_rate is None and output_fmt not in self._LOSSY_FORMATS
+        tasks = [
+            (
+                wav_file,
+                target / (wav_file.stem + suffix),
+                self._COPY_ARGS
+                if can_copy and wav_file.suffix.lower() == suffix
+                else export_args,
+            )
+            for wav_file in files
+        ]
+        if jobs <= 1 or len(tasks) == 1:
+            for wav_file, out_file, args in tasks:
+                try:
+                    _convert_one(wav_file, out_file, input_args, export_format, args, sample_rate)
+                except Exception as exc:
+                    yield wav_file, exc
+                    continue
+                yield wav_file, None
+            return
+        with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            futures = {
+                pool.submit(
+                    _convert_one,
+                    wav_file,
+                    out_file,
+                    input_args,
+                    export_format,
+                    args,
+                    sample_rate,
+                ): wav_file
+                for wav_file, out_file, args in tasks
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.exception()
+
+    def _report_progress(self, message: str, progress: int, total: int) -> None:
+        self.status.update(message)
+        self.progress.update(progress=progress, total=total)
+
     def _collect_files(self, source: Path) -> list[Path]:
         if source.is_file() and source.suffix.lower() in self._INPUT_EXTS:
             return [source]
         if source.is_dir():
-            files: list[Path] = []
-            for ext in sorted(self._INPUT_EXTS):
-                files.extend(source.glob(f"*{ext}"))
-            return sorted(set(files))
+            exts = self._INPUT_EXTS
+            with os.scandir(source) as entries:
+                found = [
+                    (entry.stat().st_size, entry.path)
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in exts and entry.is_file()
+                ]
+            # Largest first, so a long file doesn't start last and leave the other jobs idle.
+            found.sort(key=lambda item: (-item[0], item[1]))
+            # Empty files can't hold audio; don't spend an ffmpeg run on them.
+            return [Path(path) for size, path in found if size]
         return []
 
+    def _input_args(self) -> list[str]:
+        # Audio files need only a few KB to identify; ffmpeg's default probe is sized for video.
+        return ["-probesize", "32k", "-analyzeduration", "0", "-fflags", "+fastseek"]
+
     def _export_format(self, output_fmt: str) -> str:
-        if output_fmt == "m4a":
-            return "ipod"
-        return output_fmt
+        return self._EXPORT_FORMATS.get(output_fmt, output_fmt)
 
-    def _export_args(self, output_fmt: str, bitrate: str) -> dict:
+    def _export_args(self, output_fmt: str, bitrate: str) -> list[str]:
+        args = list(self._CODEC_ARGS.get(output_fmt, ()))
         if output_fmt in self._LOSSY_FORMATS:
-            return {"parameters": ["-b:a", bitrate]}
-        return {}
+            args += ["-b:a", bitrate]
+        return args
 
     def _parse_sample_rate(self) -> tuple[int | None, bool]:
         raw = self.sample_rate_input.value.strip()
@@ -452,6 +508,20 @@ class AudioConverterScreen(Screen):
             return None, False
         return rate, True
 
+    def _parse_jobs(self) -> int | None:
+        raw = self.jobs_input.value.strip()
+        if not raw:
+            return os.cpu_count() or 1
+        try:
+            jobs = int(raw)
+        except ValueError:
+            self.status.update("[red]Parallel jobs must be a number.[/red]")
+            return None
+        if jobs <= 0:
+            self.status.update("[red]Parallel jobs must be positive.[/red]")
+            return None
+        return jobs
+
     def _refresh_format_options(self) -> None:
         output_fmt = self.format_select.value or "mp3"
         is_lossy = output_fmt in self._LOSSY_FORMATS
@@ -486,60 +556,6 @@ class FFmpegPromptScreen(Screen):
             self.app.pop_screen()
 
 
-class PydubPromptScreen(Screen):
-    BINDINGS = [Binding("escape", "back", "Cancel", priority=True)]
-
-    def __init__(self, on_install: Callable[[], None]) -> None:
-        super().__init__()
-        self._on_install = on_install
-
-    def compose(self):
-        yield Header()
-        yield Static(
-            "pydub is required to convert audio.\n\nInstall it now?",
-            id="pydub-prompt",
-        )
-        with Horizontal(id="pydub-actions"):
-            yield Button("Install", id="pydub-install", variant="success")
-            yield Button("Cancel", id="pydub-cancel")
-        yield Footer()
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "pydub-install":
-            self.app.pop_screen()
-            self._on_install()
-            return
-        if event.button.id == "pydub-cancel":
-            self.app.pop_screen()
-
-
-class AudioopPromptScreen(Screen):
-    BINDINGS = [Binding("escape", "back", "Cancel", priority=True)]
-
-    def __init__(self, on_install: Callable[[], None]) -> None:
-        super().__init__()
-        self._on_install = on_install
-
-    def compose(self):
-        yield Header()
-        yield Static(
-            "audioop is required for pydub on Python 3.14.\n\nInstall it now?",
-            id="audioop-prompt",
-        )
-        with Horizontal(id="audioop-actions"):
-            yield Button("Install", id="audioop-install", variant="success")
-            yield Button("Cancel", id="audioop-cancel")
-        yield Footer()
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "audioop-install":
-            self.app.pop_screen()
-            self._on_install()
-            return
-        if event.button.id == "audioop-cancel":
-            self.app.pop_screen()
-
-
 TOOL = Tool(
     name="Audio Converter",
     description="Batch convert audio files between common formats.",
@@ -14,7 +14,7 @@ class AudioDistanceScreen(Screen):
     def __init__(self) -> None:
         super().__init__()
         self._updating = False
-        self._speed = self._speed_from_temp(20.0)
+        self._set_speed(self._speed_from_temp(20.0))
 
     def compose(self):
         yield Header()
@@ -53,7 +53,7 @@ class AudioDistanceScreen(Screen):
             temp = self._parse_float(event.value)
             if temp is None:
                 return
-            self._speed = self._speed_from_temp(temp)
+            self._set_speed(self._speed_from_temp(temp))
             self._update_speed_label()
             self._recompute_pairs()
             return
@@ -88,7 +88,7 @@ class AudioDistanceScreen(Screen):
             if value is None:
                 self._set_value(self.distance_input, "")
                 return
-            distance = self._speed * (value / 1000.0)
+            distance = value * self._meters_per_ms
             self._set_value(self.distance_input, f"{distance:.4f}")
         else:
             value = self._parse_float(self.distance_input.value)
@@ -97,7 +97,7 @@ class AudioDistanceScreen(Screen):
                 return
             if self._speed <= 0:
                 return
-            time_ms = (value / self._speed) * 1000.0
+            time_ms = value * self._ms_per_meter
             self._set_value(self.time_input, f"{time_ms:.4f}")
 
     def _update_freq_wavelength(self, *, from_freq: bool) -> None:
@@ -138,6 +138,11 @@ class AudioDistanceScreen(Screen):
     def _update_speed_label(self) -> None:
         self.speed_label.update(f"Speed of sound: {self._speed:.2f} m/s")
 
+    def _set_speed(self, speed: float) -> None:
+        self._speed = speed
+        self._meters_per_ms = speed / 1000.0
+        self._ms_per_meter = 1000.0 / speed if speed > 0 else 0.0
+
     def _speed_from_temp(self, temp_c: float) -> float:
         return 331.3 + 0.606 * temp_c
 
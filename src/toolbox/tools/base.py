@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 from textual.screen import Screen
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tool:
     name: str
     description: str
     category: str
     screen_factory: Optional[Callable[[], Screen]] = None
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "name_lower", self.name.lower())
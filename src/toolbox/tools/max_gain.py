@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 import importlib.util
+import io
+import os
+import re
 import shutil
+import stat
+import subprocess
+import threading
+import time
 
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DirectoryTree,
@@ -20,12 +31,73 @@ from textual.widgets import (
     Switch,
 )
 
+from toolbox.tools._picker import FilteredDirectoryTree
 from toolbox.tools.base import Tool
 
-
-class FilteredDirectoryTree(DirectoryTree):
-    def filter_paths(self, paths):
-        return [path for path in paths if not path.name.startswith(".")]
+_PEAK_RE = re.compile(r"Peak level dB: (\S+)")
+_PCM_RE = re.compile(r"Audio: pcm_([suf]\d+)")
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path() -> str | None:
+    return shutil.which("ffmpeg")
+
+
+@lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _ffmpeg_error(stderr: str) -> RuntimeError:
+    lines = [line for line in stderr.splitlines() if line.strip()]
+    return RuntimeError(lines[-1] if lines else "ffmpeg failed.")
+
+
+def _measure_peak(ffmpeg: str, audio_file: Path) -> tuple[float, str | None]:
+    result = subprocess.run(
+        [
+            ffmpeg,
+            "-hide_banner",
+            "-nostats",
+            "-i",
+            str(audio_file),
+            "-vn",
+            "-af",
+            "astats=measure_perchannel=none:measure_overall=Peak_level",
+            "-f",
+            "null",
+            "-",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise _ffmpeg_error(result.stderr)
+    match = _PEAK_RE.search(result.stderr)
+    if match is None:
+        raise RuntimeError("ffmpeg did not report a peak level.")
+    pcm = _PCM_RE.search(result.stderr)
+    return float(match.group(1)), pcm.group(1) if pcm else None
+
+
+def _apply_gain(
+    ffmpeg: str, audio_file: Path, out_path: Path, gain_db: float, pcm_format: str | None
+) -> None:
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", "-i", str(audio_file), "-vn"]
+    cmd += ["-af", f"volume={gain_db:.6f}dB"]
+    output_ext = out_path.suffix.lower()
+    if output_ext == ".mp3":
+        cmd += ["-q:a", "0"]
+    elif pcm_format is not None and output_ext in {".wav", ".aiff", ".aif"}:
+        # Keep the source bit depth; ffmpeg would otherwise write 16-bit PCM.
+        if pcm_format.endswith("8"):
+            cmd += ["-c:a", f"pcm_{pcm_format}"]
+        else:
+            cmd += ["-c:a", f"pcm_{pcm_format}{'le' if output_ext == '.wav' else 'be'}"]
+    cmd.append(str(out_path))
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise _ffmpeg_error(result.stderr)
 
 
 class PathPickerScreen(Screen):
@@ -68,6 +140,10 @@ class PathPickerScreen(Screen):
 
 class MaxGainScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
+    _LOG_FLUSH_INTERVAL = 0.05
+    _REPORT_INTERVAL = 0.05
+    _DEFAULT_OUTPUT_DEBOUNCE = 0.25
+    _MP3_EXPORT_ARGS = {"parameters": ["-q:a", "0"]}
     _INPUT_EXTS = {
         ".wav",
         ".mp3",
@@ -82,7 +158,11 @@ class MaxGainScreen(Screen):
 
     def __init__(self) -> None:
         super().__init__()
-        self._log_lines: list[str] = []
+        self._log_buffer = io.StringIO()
+        # Filled from worker threads and drained on a timer, one RichLog write per tick.
+        self._pending_logs: deque[str] = deque()
+        self._cancelled = threading.Event()
+        self._default_output_timer: Timer | None = None
 
     def compose(self):
         yield Header()
@@ -132,6 +212,12 @@ class MaxGainScreen(Screen):
             yield self.log_view
         yield Footer()
 
+    def on_mount(self) -> None:
+        self.set_interval(self._LOG_FLUSH_INTERVAL, self._flush_logs)
+
+    def on_unmount(self) -> None:
+        self._cancelled.set()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "maxgain-clear":
             self._clear_log()
@@ -155,7 +241,7 @@ class MaxGainScreen(Screen):
 
     def on_switch_changed(self, event: Switch.Changed) -> None:
         if event.switch.id == "maxgain-mp3":
-            self._refresh_default_output()
+            self._schedule_default_output()
 
     def _open_picker(self, *, target: str) -> None:
         current = (
@@ -170,7 +256,7 @@ class MaxGainScreen(Screen):
         def _apply(path: Path) -> None:
             if target == "source":
                 self.source_input.value = str(path)
-                self._refresh_default_output()
+                self._schedule_default_output()
                 return
             self.output_folder_input.value = str(path)
 
@@ -206,21 +292,21 @@ class MaxGainScreen(Screen):
         )
 
     def _deps_ready(self) -> bool:
-        if importlib.util.find_spec("pydub") is None:
-            self.status.update("[red]Missing dependency: pydub.[/red]")
-            return False
-        if (
-            importlib.util.find_spec("audioop") is None
-            and importlib.util.find_spec("pyaudioop") is None
-        ):
+        if _ffmpeg_path() is not None:
+            return True
+        # Without ffmpeg, pydub can still read and write WAV on its own.
+        if not _has_module("pydub"):
+            self.status.update("[red]Missing dependency: ffmpeg.[/red]")
+        elif not _has_module("audioop") and not _has_module("pyaudioop"):
             self.status.update(
                 "[red]Missing dependency: audioop-lts (install it first).[/red]"
             )
-            return False
-        if shutil.which("ffmpeg") is None:
-            self.status.update("[red]Missing dependency: ffmpeg.[/red]")
-            return False
-        return True
+        else:
+            return True
+        # Don't remember a miss; the dependency may be installed while the app runs.
+        _ffmpeg_path.cache_clear()
+        _has_module.cache_clear()
+        return False
 
     def _resolve_source(self) -> Path | None:
         raw = self.source_input.value.strip()
@@ -264,29 +350,41 @@ class MaxGainScreen(Screen):
             output_path = output_dir / f"{source.stem}_normalised{output_ext}"
         return output_path
 
+    def _schedule_default_output(self) -> None:
+        if self._default_output_timer is not None:
+            self._default_output_timer.stop()
+        self._default_output_timer = self.set_timer(
+            self._DEFAULT_OUTPUT_DEBOUNCE, self._refresh_default_output
+        )
+
     def _refresh_default_output(self) -> None:
+        self._default_output_timer = None
         if self.output_name_input.value.strip():
             return
         raw = self.source_input.value.strip()
         if not raw:
             return
         source = Path(raw).expanduser()
-        if not source.exists():
+        try:
+            mode = source.stat().st_mode
+        except OSError:
             return
-        if source.is_dir():
+        if stat.S_ISDIR(mode):
             self.output_folder_input.placeholder = f"Default: {source / 'normalized'}"
             return
         output_ext = ".mp3" if self.to_mp3.value else source.suffix.lower()
         self.output_name_input.placeholder = f"Default: {source.stem}_normalised{output_ext}"
 
     def _worker(self, source: Path, output_path: Path, target_dbfs: float) -> None:
-        try:
-            from pydub import AudioSegment
-        except Exception as exc:
-            self.app.call_from_thread(
-                self.status.update, f"[red]pydub error: {exc}[/red]"
-            )
-            return
+        ffmpeg = _ffmpeg_path()
+        if ffmpeg is None:
+            try:
+                import pydub  # noqa: F401
+            except Exception as exc:
+                self.app.call_from_thread(
+                    self.status.update, f"[red]pydub error: {exc}[/red]"
+                )
+                return
 
         files = self._collect_files(source)
         if not files:
@@ -296,42 +394,47 @@ class MaxGainScreen(Screen):
             )
             return
 
-        output_dir = output_path if source.is_dir() else output_path.parent
+        batch = source.is_dir()
+        output_dir = output_path if batch else output_path.parent
         output_dir.mkdir(parents=True, exist_ok=True)
+        fixed_ext = ".mp3" if self.to_mp3.value else None
         total = len(files)
-        self.app.call_from_thread(self.progress.update, progress=0, total=total)
+        call_from_thread = self.app.call_from_thread
+        call_from_thread(self.progress.update, progress=0, total=total)
+
+        tasks: list[tuple[Path, Path]] = []
+        for audio_file in files:
+            if batch:
+                output_ext = fixed_ext or audio_file.suffix.lower()
+                tasks.append((audio_file, output_dir / f"{audio_file.stem}_normalised{output_ext}"))
+            else:
+                tasks.append((audio_file, output_path))
 
         errors: list[str] = []
-        for index, audio_file in enumerate(files, start=1):
-            try:
-                audio = AudioSegment.from_file(audio_file)
-                peak = audio.max_dBFS
-                if peak == float("-inf"):
-                    gain_needed = 0.0
-                    self.app.call_from_thread(
-                        self._log, f"{audio_file.name}: silent input; no gain applied."
-                    )
+        last_report = 0.0
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, total)) as pool:
+            futures = {
+                pool.submit(
+                    self._process_one, audio_file, out_path, target_dbfs, ffmpeg
+                ): audio_file
+                for audio_file, out_path in tasks
+            }
+            for index, future in enumerate(as_completed(futures), start=1):
+                audio_file = futures[future]
+                try:
+                    lines = future.result()
+                except Exception as exc:
+                    errors.append(f"{audio_file.name}: {exc}")
                 else:
-                    gain_needed = target_dbfs - peak
-
-                self.app.call_from_thread(
-                    self._log,
-                    f"{audio_file.name}: peak {peak:.2f} dBFS -> gain {gain_needed:.2f} dB",
-                )
-
-                normalized = audio.apply_gain(gain_needed)
-                output_ext = ".mp3" if self.to_mp3.value else audio_file.suffix.lower()
-                out_name = f"{audio_file.stem}_normalised{output_ext}"
-                out_path = output_dir / out_name if source.is_dir() else output_path
-                file_format = out_path.suffix.lower().lstrip(".")
-                export_args = {}
-                if file_format == "mp3":
-                    export_args = {"parameters": ["-q:a", "0"]}
-                normalized.export(out_path, format=file_format, **export_args)
-                self.app.call_from_thread(self._log, f"Saved: {out_path}")
-            except Exception as exc:
-                errors.append(f"{audio_file.name}: {exc}")
-            self.app.call_from_thread(self.progress.update, progress=index, total=total)
+                    self._pending_logs.extend(lines)
+                now = time.monotonic()
+                if index == total or now - last_report >= self._REPORT_INTERVAL:
+                    last_report = now
+                    call_from_thread(self.progress.update, progress=index, total=total)
+                if self._cancelled.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    return
 
         if errors:
             self.app.call_from_thread(
@@ -343,21 +446,60 @@ class MaxGainScreen(Screen):
                 self.status.update, "[green]MaxGain completed.[/green]"
             )
 
-    def _log(self, text: str) -> None:
-        self._log_lines.append(text)
+    def _process_one(
+        self, audio_file: Path, out_path: Path, target_dbfs: float, ffmpeg: str | None
+    ) -> list[str]:
+        lines: list[str] = []
+        if ffmpeg is not None:
+            peak, pcm_format = _measure_peak(ffmpeg, audio_file)
+        else:
+            from pydub import AudioSegment
+
+            audio = AudioSegment.from_file(audio_file)
+            peak = audio.max_dBFS
+        if peak == float("-inf"):
+            gain_needed = 0.0
+            lines.append(f"{audio_file.name}: silent input; no gain applied.")
+        else:
+            gain_needed = target_dbfs - peak
+        lines.append(f"{audio_file.name}: peak {peak:.2f} dBFS -> gain {gain_needed:.2f} dB")
+
+        if ffmpeg is not None:
+            _apply_gain(ffmpeg, audio_file, out_path, gain_needed, pcm_format)
+            lines.append(f"Saved: {out_path}")
+            return lines
+
+        normalized = audio.apply_gain(gain_needed)
+        file_format = out_path.suffix.lower().lstrip(".")
+        export_args = self._MP3_EXPORT_ARGS if file_format == "mp3" else {}
+        normalized.export(out_path, format=file_format, **export_args)
+        lines.append(f"Saved: {out_path}")
+        return lines
+
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        batch: list[str] = []
+        while self._pending_logs:
+            batch.append(self._pending_logs.popleft())
+        text = "\n".join(batch)
+        if self._log_buffer.tell():
+            self._log_buffer.write("\n")
+        self._log_buffer.write(text)
         self.log_view.write(text)
 
     def _clear_log(self) -> None:
-        self._log_lines.clear()
+        self._pending_logs.clear()
+        self._log_buffer = io.StringIO()
         self.log_view.clear()
         self.status.update("")
         self.progress.update(progress=0, total=0)
 
     def _copy_log(self) -> None:
-        if not self._log_lines:
+        if not self._log_buffer.tell():
             self.status.update("[yellow]Log is empty.[/yellow]")
             return
-        self.app.copy_to_clipboard("\n".join(self._log_lines))
+        self.app.copy_to_clipboard(self._log_buffer.getvalue())
         self.status.update("[green]Log copied to clipboard.[/green]")
 
     def _parse_target_dbfs(self) -> float | None:
@@ -375,10 +517,15 @@ class MaxGainScreen(Screen):
         if source.is_file() and source.suffix.lower() in self._INPUT_EXTS:
             return [source]
         if source.is_dir():
-            files: list[Path] = []
-            for ext in sorted(self._INPUT_EXTS):
-                files.extend(source.glob(f"*{ext}"))
-            return sorted(set(files))
+            exts = self._INPUT_EXTS
+            with os.scandir(source) as entries:
+                files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in exts and entry.is_file()
+                ]
+            files.sort()
+            return files
         return []
 
 
@@ -3,8 +3,11 @@ from __future__ import annotations
 import platform
 import re
 import shutil
+import socket
 import subprocess
+import time
 from dataclasses import dataclass
+from typing import Iterator
 
 from textual.binding import Binding
 from textual.containers import ScrollableContainer
@@ -13,6 +16,24 @@ from textual.widgets import Button, Footer, Header, RichLog, Static
 
 from toolbox.tools.base import Tool
 
+_SYSTEM = platform.system().lower()
+_IP_PATH = shutil.which("ip")
+_INET_RE = re.compile(r"inet\s+([0-9.]+)")
+_IPV4_RE = re.compile(r"IPv4 Address[^\d]*([\d.]+)")
+
+
+def _command_lines(cmd: list[str]) -> Iterator[str]:
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as process:
+        for line in process.stdout:
+            yield line.rstrip("\r\n")
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
 
 @dataclass(frozen=True)
 class InterfaceAddress:
@@ -22,6 +43,12 @@ class InterfaceAddress:
 
 class NetworkInfoScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
+    _CACHE_TTL = 1.0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cached_addresses: list[InterfaceAddress] = []
+        self._cached_at = 0.0
 
     def compose(self):
         yield Header()
@@ -49,74 +76,84 @@ class NetworkInfoScreen(Screen):
             self.log_view.write(f"{item.name}: {item.address}")
 
     def _collect_addresses(self) -> list[InterfaceAddress]:
-        system = platform.system().lower()
-        if system == "windows":
+        now = time.monotonic()
+        if self._cached_addresses and now - self._cached_at < self._CACHE_TTL:
+            return self._cached_addresses
+        addresses = self._read_psutil()
+        if addresses is None:
+            addresses = self._read_commands()
+        self._cached_addresses = addresses
+        self._cached_at = now
+        return addresses
+
+    def _read_psutil(self) -> list[InterfaceAddress] | None:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return [
+            InterfaceAddress(name, item.address)
+            for name, items in psutil.net_if_addrs().items()
+            for item in items
+            if item.family == socket.AF_INET
+        ]
+
+    def _read_commands(self) -> list[InterfaceAddress]:
+        if _SYSTEM == "windows":
             return self._parse_ipconfig()
-        if shutil.which("ip"):
+        if _IP_PATH:
             addresses = self._parse_ip_addr()
             if addresses:
                 return addresses
         return self._parse_ifconfig()
 
     def _parse_ip_addr(self) -> list[InterfaceAddress]:
-        result = subprocess.run(
-            ["ip", "-o", "-4", "addr", "show"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
         addresses: list[InterfaceAddress] = []
-        for line in result.stdout.splitlines():
-            parts = line.split()
-            if len(parts) < 4:
-                continue
-            iface = parts[1]
-            ip = parts[3].split("/")[0]
-            addresses.append(InterfaceAddress(iface, ip))
+        try:
+            for line in _command_lines([_IP_PATH, "-o", "-4", "addr", "show"]):
+                parts = line.split()
+                if len(parts) < 4:
+                    continue
+                iface = parts[1]
+                ip = parts[3].split("/")[0]
+                addresses.append(InterfaceAddress(iface, ip))
+        except subprocess.CalledProcessError:
+            return []
         return addresses
 
     def _parse_ifconfig(self) -> list[InterfaceAddress]:
-        result = subprocess.run(
-            ["ifconfig"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
         addresses: list[InterfaceAddress] = []
         current_iface: str | None = None
-        for line in result.stdout.splitlines():
-            if line and not line.startswith("\t") and not line.startswith(" "):
-                current_iface = line.split(":")[0]
-                continue
-            if current_iface is None:
-                continue
-            line = line.strip()
-            if line.startswith("inet "):
-                match = re.search(r"inet\s+([0-9.]+)", line)
-                if match:
-                    addresses.append(InterfaceAddress(current_iface, match.group(1)))
+        try:
+            for line in _command_lines(["ifconfig"]):
+                if line and not line.startswith("\t") and not line.startswith(" "):
+                    current_iface = line.split(":")[0]
+                    continue
+                if current_iface is None:
+                    continue
+                line = line.strip()
+                if line.startswith("inet "):
+                    match = _INET_RE.search(line)
+                    if match:
+                        addresses.append(InterfaceAddress(current_iface, match.group(1)))
+        except subprocess.CalledProcessError:
+            return []
         return addresses
 
     def _parse_ipconfig(self) -> list[InterfaceAddress]:
-        result = subprocess.run(
-            ["ipconfig"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return []
         addresses: list[InterfaceAddress] = []
         current_iface: str | None = None
-        for line in result.stdout.splitlines():
-            if line and not line.startswith(" "):
-                current_iface = line.strip().rstrip(":")
-                continue
-            if "IPv4 Address" in line:
-                match = re.search(r"IPv4 Address[^\d]*([\d.]+)", line)
-                if match and current_iface:
-                    addresses.append(InterfaceAddress(current_iface, match.group(1)))
+        try:
+            for line in _command_lines(["ipconfig"]):
+                if line and not line.startswith(" "):
+                    current_iface = line.strip().rstrip(":")
+                    continue
+                if "IPv4 Address" in line:
+                    match = _IPV4_RE.search(line)
+                    if match and current_iface:
+                        addresses.append(InterfaceAddress(current_iface, match.group(1)))
+        except subprocess.CalledProcessError:
+            return []
         return addresses
 
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import io
+import socket
 import threading
+from collections import deque
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from pythonosc import dispatcher, osc_server, udp_client
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.screen import Screen
@@ -11,20 +14,26 @@ from textual.widgets import Button, Footer, Header, Input, Label, RichLog, Stati
 
 from toolbox.tools.base import Tool
 
+if TYPE_CHECKING:
+    from pythonosc import osc_server, udp_client
+
 
 @dataclass
 class _OscServerState:
-    server: osc_server.ThreadingOSCUDPServer | None = None
+    server: osc_server.BlockingOSCUDPServer | None = None
     thread: threading.Thread | None = None
 
 
 class OscToolScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
+    _LOG_FLUSH_INTERVAL = 0.05
 
     def __init__(self) -> None:
         super().__init__()
         self._server_state = _OscServerState()
-        self._log_lines: list[str] = []
+        self._log_buffer = io.StringIO()
+        self._clients: dict[tuple[str, int], udp_client.SimpleUDPClient] = {}
+        self._pending_logs: deque[str] = deque()
 
     def compose(self):
         yield Header()
@@ -66,6 +75,14 @@ class OscToolScreen(Screen):
             yield self.log_view
         yield Footer()
 
+    def on_mount(self) -> None:
+        self.set_interval(self._LOG_FLUSH_INTERVAL, self._flush_logs)
+
+    def on_unmount(self) -> None:
+        for client in self._clients.values():
+            self._close_client(client)
+        self._clients.clear()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "osc-send":
             self._send_message()
@@ -98,12 +115,33 @@ class OscToolScreen(Screen):
 
         args = self._parse_args(self.send_args.value)
         try:
-            client = udp_client.SimpleUDPClient(host, port)
+            client = self._client_for(host, port)
             client.send_message(address, args)
             self.status.update("[green]OSC message sent.[/green]")
         except Exception as exc:
+            stale = self._clients.pop((host, port), None)
+            if stale is not None:
+                self._close_client(stale)
             self.status.update(f"[red]Send failed: {exc}[/red]")
 
+    def _client_for(self, host: str, port: int) -> udp_client.SimpleUDPClient:
+        key = (host, port)
+        client = self._clients.get(key)
+        if client is None:
+            from pythonosc import udp_client
+
+            # Resolve once so sendto doesn't look the host name up on every message.
+            sockaddr = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0][4]
+            client = udp_client.SimpleUDPClient(sockaddr[0], port)
+            self._clients[key] = client
+        return client
+
+    @staticmethod
+    def _close_client(client: udp_client.SimpleUDPClient) -> None:
+        # Older python-osc clients have no close(); their socket is still there.
+        close = getattr(client, "close", None) or client._sock.close
+        close()
+
     def _start_server(self) -> None:
         if self._server_state.server is not None:
             self.status.update("[yellow]Receiver already running.[/yellow]")
@@ -116,10 +154,12 @@ class OscToolScreen(Screen):
             self.status.update("[red]Port must be a number.[/red]")
             return
 
+        from pythonosc import dispatcher, osc_server
+
         osc_dispatcher = dispatcher.Dispatcher()
         osc_dispatcher.set_default_handler(self._handle_message)
         try:
-            server = osc_server.ThreadingOSCUDPServer((host, port), osc_dispatcher)
+            server = osc_server.BlockingOSCUDPServer((host, port), osc_dispatcher)
             thread = threading.Thread(target=server.serve_forever, daemon=True)
             thread.start()
             self._server_state = _OscServerState(server=server, thread=thread)
@@ -138,24 +178,31 @@ class OscToolScreen(Screen):
         self.status.update("[green]Receiver stopped.[/green]")
 
     def _handle_message(self, address, *args) -> None:
-        self.app.call_from_thread(
-            self._log, f"{address} {list(args)}"
-        )
+        self._pending_logs.append(f"{address} {list(args)}")
 
-    def _log(self, text: str) -> None:
-        self._log_lines.append(text)
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        batch: list[str] = []
+        while self._pending_logs:
+            batch.append(self._pending_logs.popleft())
+        text = "\n".join(batch)
+        if self._log_buffer.tell():
+            self._log_buffer.write("\n")
+        self._log_buffer.write(text)
         self.log_view.write(text)
 
     def _clear_log(self) -> None:
-        self._log_lines.clear()
+        self._pending_logs.clear()
+        self._log_buffer = io.StringIO()
         self.log_view.clear()
         self.status.update("")
 
     def _copy_log(self) -> None:
-        if not self._log_lines:
+        if not self._log_buffer.tell():
             self.status.update("[yellow]Log is empty.[/yellow]")
             return
-        self.app.copy_to_clipboard("\n".join(self._log_lines))
+        self.app.copy_to_clipboard(self._log_buffer.getvalue())
         self.status.update("[green]Log copied to clipboard.[/green]")
 
     @staticmethod
@@ -167,6 +214,11 @@ class OscToolScreen(Screen):
         for part in parts:
             if part == "":
                 continue
+            digits = part[1:] if part[0] in "+-" else part
+            if digits.isascii() and digits.isdigit():
+                parsed.append(int(part))
+                continue
+            # int() also accepts underscores and non-ASCII digits, e.g. "1_000".
             for caster in (int, float):
                 try:
                     parsed.append(caster(part))
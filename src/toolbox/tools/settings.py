@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import http.client
+import io
 import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import tomllib
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from textual.binding import Binding
@@ -16,6 +23,46 @@ from textual.containers import Horizontal, ScrollableContainer
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Label, RichLog, Select, Static
 
+from toolbox.app import _UPDATE_CACHE_TTL
+
+_VERSION_SPLIT_RE = re.compile(r"[.+-]")
+_COPY_BUFSIZE = 1024 * 1024
+_REMOTE_HOST = "raw.githubusercontent.com"
+_FILE_WORKERS = 8
+
+
+@lru_cache(maxsize=1)
+def _git_path() -> str | None:
+    return shutil.which("git")
+
+
+@lru_cache(maxsize=128)
+def _parse_version(value: str) -> tuple[int, ...]:
+    nums: list[int] = []
+    for part in _VERSION_SPLIT_RE.split(value):
+        if not part.isdigit():
+            break
+        nums.append(int(part))
+    return tuple(nums)
+
+
+@lru_cache(maxsize=4)
+def _read_version_cached(repo_root: Path) -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("toolbox")
+    except Exception:
+        pass
+    try:
+        with (repo_root / "pyproject.toml").open("rb") as handle:
+            data = tomllib.load(handle)
+    except Exception:
+        return "dev"
+    project = data.get("project")
+    value = project.get("version") if isinstance(project, dict) else None
+    return str(value) if value else "dev"
+
 
 class SettingsScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
@@ -24,6 +71,10 @@ class SettingsScreen(Screen):
         super().__init__()
         self._repo_root = Path(__file__).resolve().parents[3]
         self._config_path = self._repo_root / ".toolbox_config.json"
+        self._http: http.client.HTTPSConnection | None = None
+        self._http_lock = threading.RLock()
+        self._prefetched: dict[str, tuple[str, float]] = {}
+        self._log_buffer = io.StringIO()
 
     def compose(self):
         yield Header()
@@ -51,6 +102,12 @@ class SettingsScreen(Screen):
         version = self._read_version()
         self.version_label.update(f"Version: {version}")
         self._load_branch_setting()
+        self.run_worker(self._prefetch_worker, thread=True)
+
+    def on_unmount(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "settings-branch":
@@ -58,10 +115,11 @@ class SettingsScreen(Screen):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "settings-clear":
+            self._log_buffer = io.StringIO()
             self.log_view.clear()
             return
         if event.button.id == "settings-copy":
-            text = "\n".join(self._line_to_text(line) for line in self.log_view.lines)
+            text = self._log_buffer.getvalue()
             if not text.strip():
                 self._log("Log is empty.")
                 return
@@ -75,27 +133,24 @@ class SettingsScreen(Screen):
             self.run_worker(self._update_worker, thread=True)
 
     def _read_version(self) -> str:
-        try:
-            from importlib.metadata import PackageNotFoundError, version
-        except Exception:
-            PackageNotFoundError = Exception
+        return _read_version_cached(self._repo_root)
 
-            def version(_: str) -> str:
-                raise PackageNotFoundError()
-
-        try:
-            return version("toolbox")
-        except Exception:
-            pyproject = self._repo_root / "pyproject.toml"
-            if not pyproject.exists():
-                return "dev"
-            text = pyproject.read_text(encoding="utf-8")
-            return self._parse_version_toml(text, str(pyproject)) or "dev"
+    def _prefetch_worker(self) -> None:
+        branch = self.branch_select.value or "main"
+        with self._http_lock:
+            remote_version = self._fetch_remote_version(branch, quiet=True)
+            if remote_version is not None:
+                self._prefetched[branch] = (remote_version, time.monotonic())
 
     def _check_updates_worker(self) -> None:
         branch = self.branch_select.value or "main"
         local_version = self._read_version()
-        remote_version = self._fetch_remote_version(branch)
+        # Use the version fetched on mount once, while it is fresh; later
+        # checks hit the network.
+        with self._http_lock:
+            remote_version, fetched_at = self._prefetched.pop(branch, (None, 0.0))
+            if remote_version is None or time.monotonic() - fetched_at >= _UPDATE_CACHE_TTL:
+                remote_version = self._fetch_remote_version(branch)
         if remote_version is None:
             self._log(f"Failed to fetch remote version for branch '{branch}'.")
             return
@@ -105,20 +160,34 @@ class SettingsScreen(Screen):
         self._log(f"Update available: {local_version} -> {remote_version}")
 
     def _update_worker(self) -> None:
-        if shutil.which("python") is None and shutil.which("python3") is None:
+        # pip runs under sys.executable, so there is no PATH lookup to do.
+        if not sys.executable:
             self._log("Python is not available.")
             return
         branch = self.branch_select.value or "main"
-        if self._has_uncommitted_changes():
-            self._log("Local changes detected. Back up or commit before updating.")
-            return
-        if not self._download_and_replace(branch):
-            return
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(max_workers=1) as pool:
+            # Fetch and unpack the archive while git checks the working tree.
+            cancelled = threading.Event()
+            download = pool.submit(self._download_archive, branch, Path(tmpdir), cancelled)
+            if self._has_uncommitted_changes():
+                # Stop the download at its next chunk so leaving the pool is quick.
+                cancelled.set()
+                self._log("Local changes detected. Back up or commit before updating.")
+                return
+            source_root = download.result()
+            if source_root is None:
+                return
+            try:
+                self._replace_tree(source_root, self._repo_root)
+            except Exception as exc:
+                self._log(f"Update failed: {exc}")
+                return
         self._log("Updating dependencies...")
         pip = self._run_command([sys.executable, "-m", "pip", "install", "-e", "."])
         if pip.returncode != 0:
             self._log(pip.stderr or pip.stdout or "Dependency update failed.")
             return
+        _read_version_cached.cache_clear()
         version = self._read_version()
         self.version_label.update(f"Version: {version}")
         self._log("Update complete. Restart the app to apply changes.")
@@ -127,67 +196,132 @@ class SettingsScreen(Screen):
         git_dir = self._repo_root / ".git"
         if not git_dir.exists():
             return False
-        if shutil.which("git") is None:
+        git = _git_path()
+        if git is None:
+            # Don't cache the miss; git may be installed while the app runs.
+            _git_path.cache_clear()
             return False
-        status = self._run_command(["git", "status", "--porcelain"])
-        return bool(status.stdout.strip())
-
-    def _fetch_remote_version(self, branch: str) -> str | None:
-        url = f"https://raw.githubusercontent.com/clevrthings/Toolbox/{branch}/pyproject.toml"
-        request = urllib.request.Request(
-            url,
-            headers={"User-Agent": "Toolbox-Updater"},
+        # diff-index trusts cached stat data; refresh it so files whose mtime
+        # changed (e.g. rewritten by a previous update) aren't reported as dirty.
+        self._run_command([git, "update-index", "-q", "--refresh"])
+        # diff-index exits 1 on tracked changes without formatting any output.
+        tracked = self._run_command([git, "diff-index", "--quiet", "HEAD", "--"])
+        if tracked.returncode == 1:
+            return True
+        if tracked.returncode != 0:
+            status = self._run_command([git, "status", "--porcelain"])
+            return bool(status.stdout.strip())
+        # Untracked files would be removed by the update too.
+        untracked = self._run_command(
+            [git, "ls-files", "--others", "--exclude-standard", "--directory", "--no-empty-directory"]
         )
-        try:
-            with urllib.request.urlopen(request, timeout=10) as response:
-                text = response.read().decode("utf-8")
-                status = getattr(response, "status", 200)
-        except Exception as exc:
-            self._log(f"Fetch failed: {exc}")
-            return None
+        return bool(untracked.stdout.strip())
+
+    def _fetch_remote_version(self, branch: str, quiet: bool = False) -> str | None:
+        path = f"/clevrthings/Toolbox/{branch}/pyproject.toml"
+        url = f"https://{_REMOTE_HOST}{path}"
+        with self._http_lock:
+            if self._http is None:
+                self._http = http.client.HTTPSConnection(_REMOTE_HOST, timeout=10)
+            try:
+                self._http.request("GET", path, headers={"User-Agent": "Toolbox-Updater"})
+                response = self._http.getresponse()
+                status = response.status
+                if status != 200:
+                    response.read()
+                else:
+                    data = tomllib.load(response)
+            except tomllib.TOMLDecodeError as exc:
+                if not quiet:
+                    self._log(f"Failed to parse pyproject.toml: {exc}")
+                return None
+            except Exception as exc:
+                self._http.close()
+                self._http = None
+                if not quiet:
+                    self._log(f"Fetch failed: {exc}")
+                return None
         if status != 200:
-            self._log(f"Fetch failed: HTTP {status}")
+            if not quiet:
+                self._log(f"Fetch failed: HTTP {status}")
             return None
-        return self._parse_version_toml(text, url)
+        return self._project_version(data, url, quiet)
 
-    def _download_and_replace(self, branch: str) -> bool:
+    def _download_archive(
+        self, branch: str, workdir: Path, cancelled: threading.Event
+    ) -> Path | None:
         url = f"https://github.com/clevrthings/Toolbox/archive/refs/heads/{branch}.zip"
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                zip_path = Path(tmpdir) / "update.zip"
-                with urllib.request.urlopen(url, timeout=20) as response:
-                    zip_path.write_bytes(response.read())
-                extract_dir = Path(tmpdir) / "extract"
-                extract_dir.mkdir(parents=True, exist_ok=True)
-                with zipfile.ZipFile(zip_path) as archive:
-                    archive.extractall(extract_dir)
-                root_dirs = [p for p in extract_dir.iterdir() if p.is_dir()]
-                if not root_dirs:
-                    self._log("Update failed: no files in archive.")
-                    return False
-                source_root = root_dirs[0]
-                self._replace_tree(source_root, self._repo_root)
-                return True
+            zip_path = workdir / "update.zip"
+            with urllib.request.urlopen(url, timeout=20) as response:
+                with zip_path.open("wb") as handle:
+                    while chunk := response.read(_COPY_BUFSIZE):
+                        if cancelled.is_set():
+                            return None
+                        handle.write(chunk)
+            if cancelled.is_set():
+                return None
+            extract_dir = workdir / "extract"
+            extract_dir.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(zip_path) as archive:
+                self._extract_archive(archive, extract_dir)
         except Exception as exc:
-            self._log(f"Update failed: {exc}")
-            return False
+            if not cancelled.is_set():
+                self._log(f"Update failed: {exc}")
+            return None
+        root_dirs = [p for p in extract_dir.iterdir() if p.is_dir()]
+        if not root_dirs:
+            self._log("Update failed: no files in archive.")
+            return None
+        return root_dirs[0]
+
+    def _extract_archive(self, archive: zipfile.ZipFile, dest: Path) -> None:
+        root = dest.resolve()
+        files: list[tuple[zipfile.ZipInfo, Path]] = []
+        for info in archive.infolist():
+            target = (root / info.filename).resolve()
+            if not target.is_relative_to(root):
+                raise ValueError(f"unsafe path in archive: {info.filename}")
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            files.append((info, target))
+
+        def _extract_one(entry: tuple[zipfile.ZipInfo, Path]) -> None:
+            info, target = entry
+            with archive.open(info) as source, target.open("wb") as handle:
+                shutil.copyfileobj(source, handle, _COPY_BUFSIZE)
+
+        # Directories are created up front so the workers only write files.
+        with ThreadPoolExecutor(max_workers=_FILE_WORKERS) as pool:
+            list(pool.map(_extract_one, files))
 
     def _replace_tree(self, source: Path, dest: Path) -> None:
         keep = {".git", ".venv", ".toolbox_config.json", "run.sh", "push.sh"}
-        for item in dest.iterdir():
-            if item.name in keep:
-                continue
+        # Renames are O(1) when the temp dir shares the repo's filesystem.
+        same_device = os.stat(source).st_dev == os.stat(dest).st_dev
+
+        def _remove(item: Path) -> None:
             if item.is_dir():
                 shutil.rmtree(item)
             else:
                 item.unlink()
-        for item in source.iterdir():
+
+        def _install(item: Path) -> None:
             target = dest / item.name
-            if item.is_dir():
+            if same_device and not (item.is_dir() and target.exists()):
+                os.replace(item, target)
+            elif item.is_dir():
                 shutil.copytree(item, target, dirs_exist_ok=True)
             else:
                 shutil.copy2(item, target)
 
+        stale = [item for item in dest.iterdir() if item.name not in keep]
+        with ThreadPoolExecutor(max_workers=_FILE_WORKERS) as pool:
+            list(pool.map(_remove, stale))
+            list(pool.map(_install, list(source.iterdir())))
+
     def _run_command(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
         return subprocess.run(
             cmd,
@@ -197,53 +331,28 @@ class SettingsScreen(Screen):
         )
 
     def _log(self, message: str) -> None:
+        if self._log_buffer.tell():
+            self._log_buffer.write("\n")
+        self._log_buffer.write(message)
         try:
             self.log_view.write(message)
         except Exception:
             self.app.call_from_thread(self.log_view.write, message)
 
     def _compare_versions(self, local: str, remote: str) -> int:
-        def _parse(value: str) -> tuple[int, ...]:
-            parts = re.split(r"[.+-]", value)
-            nums: list[int] = []
-            for part in parts:
-                if part.isdigit():
-                    nums.append(int(part))
-                else:
-                    break
-            return tuple(nums)
-
-        local_tuple = _parse(local)
-        remote_tuple = _parse(remote)
-        if local_tuple == remote_tuple:
-            return 0
-        if local_tuple > remote_tuple:
-            return 1
-        return -1
-
-    def _parse_version_toml(self, text: str, url: str) -> str | None:
-        try:
-            data = tomllib.loads(text)
-        except Exception as exc:
-            self._log(f"Failed to parse pyproject.toml: {exc}")
-            return None
-        project = data.get("project") if isinstance(data, dict) else None
+        local_tuple = _parse_version(local)
+        remote_tuple = _parse_version(remote)
+        return (local_tuple > remote_tuple) - (local_tuple < remote_tuple)
+
+    def _project_version(self, data: dict, url: str, quiet: bool = False) -> str | None:
+        project = data.get("project")
         version = project.get("version") if isinstance(project, dict) else None
         if not version:
-            self._log(f"Version not found in remote pyproject.toml ({url}).")
+            if not quiet:
+                self._log(f"Version not found in remote pyproject.toml ({url}).")
             return None
         return str(version)
 
-    def _line_to_text(self, line) -> str:
-        if hasattr(line, "segments"):
-            return "".join(getattr(segment, "text", "") for segment in line.segments)
-        if hasattr(line, "plain"):
-            return line.plain
-        if hasattr(line, "text"):
-            text = line.text
-            return getattr(text, "plain", str(text))
-        return str(line)
-
     def _load_branch_setting(self) -> None:
         if not self._config_path.exists():
             return
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from fractions import Fraction
 from pathlib import Path
-import importlib.util
+import io
+import os
+import re
 import shutil
+import subprocess
+import time
 
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer
 from textual.screen import Screen
 from textual.widgets import (
     Button,
-    DirectoryTree,
     Footer,
     Header,
     Input,
@@ -20,49 +27,127 @@ from textual.widgets import (
     Switch,
 )
 
+from toolbox.tools._picker import FolderPickerScreen
 from toolbox.tools.base import Tool
 
 
-class FilteredDirectoryTree(DirectoryTree):
-    def filter_paths(self, paths):
-        return [path for path in paths if not path.name.startswith(".")]
-
-
-class PathPickerScreen(Screen):
-    BINDINGS = [Binding("escape", "back", "Cancel", priority=True)]
-
-    def __init__(
-        self,
-        *,
-        on_selected,
-        start_path: Path | None = None,
-        title: str = "Select folder",
-    ) -> None:
-        super().__init__()
-        self._on_selected = on_selected
-        self._start_path = start_path or Path.home()
-        self._title = title
+_PCM_RE = re.compile(r"pcm_([suf]\d+)")
+_PAIR_RE = re.compile(r"^(?P<key>.+)[._%](?P<side>[LlRr])(?P<ext>\.[^.]+)$")
+_PROBE_ENTRIES = (
+    "stream=codec_name,sample_rate,channels,sample_fmt,duration_ts,time_base"
+    ":format=duration"
+)
 
-    def compose(self):
-        yield Header()
-        yield Static(self._title, id="stereo-picker-title")
-        yield FilteredDirectoryTree(self._start_path, id="stereo-picker-tree")
-        yield Footer()
 
-    def on_directory_tree_directory_selected(
-        self, event: DirectoryTree.DirectorySelected
-    ) -> None:
-        self._on_selected(event.path)
-        self.app.pop_screen()
+@dataclass(frozen=True)
+class _AudioInfo:
+    codec: str
+    rate: int
+    channels: int
+    sample_fmt: str
+    samples: int
+
+
+def _ffmpeg_error(stderr: str) -> RuntimeError:
+    lines = [line for line in stderr.splitlines() if line.strip()]
+    return RuntimeError(lines[-1] if lines else "ffmpeg failed.")
+
+
+def _probe(ffprobe: str, path: Path) -> _AudioInfo:
+    # Header only: ffprobe reads the container, nothing is decoded.
+    result = subprocess.run(
+        [
+            ffprobe, "-v", "error", "-select_streams", "a:0",
+            "-show_entries", _PROBE_ENTRIES, "-of", "default=noprint_wrappers=1",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise _ffmpeg_error(result.stderr)
+    fields = dict(
+        line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+    )
+    try:
+        rate = int(fields["sample_rate"])
+        if fields.get("duration_ts", "N/A") != "N/A":
+            # For PCM and FLAC the time base is 1/rate, so this is exact.
+            seconds = int(fields["duration_ts"]) * Fraction(fields["time_base"])
+        else:
+            seconds = Fraction(fields["duration"])
+        return _AudioInfo(
+            codec=fields["codec_name"],
+            rate=rate,
+            channels=int(fields["channels"]),
+            sample_fmt=fields.get("sample_fmt", ""),
+            samples=round(seconds * rate),
+        )
+    except (KeyError, ValueError, ZeroDivisionError) as exc:
+        raise RuntimeError(f"Could not read audio info from {path.name}.") from exc
+
+
+def _merge_to_stereo(
+    ffmpeg: str,
+    ffprobe: str,
+    left_path: Path,
+    right_path: Path,
+    output_path: Path,
+    delete: bool,
+) -> None:
+    # amerge cuts to the shorter input and -ac 2 would downmix extra channels,
+    # so refuse anything that wouldn't merge losslessly.
+    left = _probe(ffprobe, left_path)
+    right = _probe(ffprobe, right_path)
+    for path, info in ((left_path, left), (right_path, right)):
+        if info.channels != 1:
+            raise ValueError(f"{path.name} is not mono ({info.channels} channels).")
+    if left.rate != right.rate or left.sample_fmt != right.sample_fmt:
+        raise ValueError("Input files differ in parameters.")
+    if left.samples != right.samples:
+        raise ValueError("Input files differ in length.")
+
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y"]
+    cmd += ["-i", str(left_path), "-i", str(right_path)]
+    cmd += ["-filter_complex", "[0:a][1:a]amerge=inputs=2", "-ac", "2"]
+    output_ext = output_path.suffix.lower()
+    pcm = _PCM_RE.match(left.codec)
+    if output_ext == ".mp3":
+        cmd += ["-q:a", "0"]
+    elif output_ext in {".wav", ".aiff", ".aif"} and pcm is not None:
+        # Keep the source bit depth; ffmpeg would otherwise write 16-bit PCM.
+        pcm_format = pcm.group(1)
+        if pcm_format.endswith("8"):
+            cmd += ["-c:a", f"pcm_{pcm_format}"]
+        else:
+            cmd += ["-c:a", f"pcm_{pcm_format}{'le' if output_ext == '.wav' else 'be'}"]
+    cmd.append(str(output_path))
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise _ffmpeg_error(result.stderr)
+    if not delete:
+        return
+    merged = _probe(ffprobe, output_path)
+    # Encoder padding may add samples, but the merge must not have lost any.
+    if merged.channels != 2 or merged.samples < left.samples:
+        raise RuntimeError(f"{output_path.name} is incomplete; sources kept.")
+    left_path.unlink(missing_ok=True)
+    right_path.unlink(missing_ok=True)
 
 
 class StereoMergerScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
-    _EXTENSIONS = {".wav", ".flac", ".mp3", ".aiff", ".aif", ".m4a", ".ogg", ".opus"}
+    _EXTENSIONS = frozenset(
+        {".wav", ".flac", ".mp3", ".aiff", ".aif", ".m4a", ".ogg", ".opus"}
+    )
+    _LOG_FLUSH_INTERVAL = 0.05
+    _REPORT_INTERVAL = 0.1
 
     def __init__(self) -> None:
         super().__init__()
-        self._log_lines: list[str] = []
+        self._log_buffer = io.StringIO()
+        # Filled from worker threads and drained on a timer, one RichLog write per tick.
+        self._pending_logs: deque[str] = deque()
 
     def compose(self):
         yield Header()
@@ -88,10 +173,13 @@ class StereoMergerScreen(Screen):
             yield self.status
             self.progress = ProgressBar(id="stereo-progress")
             yield self.progress
-            self.log_view = RichLog(id="stereo-log", highlight=True)
+            self.log_view = RichLog(id="stereo-log", highlight=False)
             yield self.log_view
         yield Footer()
 
+    def on_mount(self) -> None:
+        self.set_interval(self._LOG_FLUSH_INTERVAL, self._flush_logs)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "stereo-clear":
             self._clear_log()
@@ -115,7 +203,7 @@ class StereoMergerScreen(Screen):
             self.source_input.value = str(path)
 
         self.app.push_screen(
-            PathPickerScreen(
+            FolderPickerScreen(
                 on_selected=_apply,
                 start_path=start_path,
                 title="Select source folder",
@@ -153,120 +241,107 @@ class StereoMergerScreen(Screen):
             )
             return
 
+        ffmpeg = shutil.which("ffmpeg")
+        ffprobe = shutil.which("ffprobe")
+        if ffmpeg is None or ffprobe is None:
+            missing = "ffmpeg" if ffmpeg is None else "ffprobe"
+            self.app.call_from_thread(
+                self.status.update, f"[red]Missing dependency: {missing}.[/red]"
+            )
+            return
+        delete = self.delete_sources.value
         total = len(pairs)
         self.app.call_from_thread(self.progress.update, progress=0, total=total)
 
-        for index, (key, left, right, ext) in enumerate(pairs, start=1):
-            output_path = left.parent / f"{key}{ext}"
-            try:
-                self._merge_to_stereo(left, right, output_path)
-                if self.delete_sources.value:
-                    left.unlink(missing_ok=True)
-                    right.unlink(missing_ok=True)
-                self.app.call_from_thread(
-                    self._log, f"Merged: {output_path}"
-                )
-            except Exception as exc:
-                self.app.call_from_thread(
-                    self._log, f"Failed {key}: {exc}"
+        with ThreadPoolExecutor(max_workers=min(total, os.cpu_count() or 1)) as pool:
+            futures = {}
+            for key, left, right, ext in pairs:
+                output_path = left.parent / f"{key}{ext}"
+                future = pool.submit(
+                    _merge_to_stereo, ffmpeg, ffprobe, left, right, output_path, delete
                 )
-            self.app.call_from_thread(
-                self.progress.update, progress=index, total=total
-            )
+                futures[future] = (key, output_path)
+            last_report = 0.0
+            for index, future in enumerate(as_completed(futures), start=1):
+                key, output_path = futures[future]
+                error = future.exception()
+                if error is None:
+                    self._log(f"Merged: {output_path}")
+                else:
+                    self._log(f"Failed {key}: {error}")
+                now = time.monotonic()
+                if index == total or now - last_report >= self._REPORT_INTERVAL:
+                    last_report = now
+                    self.app.call_from_thread(
+                        self.progress.update, progress=index, total=total
+                    )
 
         self.app.call_from_thread(
             self.status.update, "[green]Stereo merge completed.[/green]"
         )
 
     def _collect_pairs(self, source: Path):
-        grouped: dict[tuple[str, str], dict[str, Path]] = {}
-        for path in source.iterdir():
-            if not path.is_file():
-                continue
-            ext = path.suffix.lower()
-            if ext not in self._EXTENSIONS:
-                continue
-            name = path.name
-            name_lower = name.lower()
-            if name_lower.endswith(f".l{ext}") or name_lower.endswith(f"%l{ext}") or name_lower.endswith(f"_l{ext}"):
-                key = (
-                    name[: -len(ext)]
-                    .replace(".L", "")
-                    .replace(".l", "")
-                    .replace("%L", "")
-                    .replace("%l", "")
-                    .replace("_L", "")
-                    .replace("_l", "")
-                )
-                grouped.setdefault((key, ext), {})["L"] = path
-            elif name_lower.endswith(f".r{ext}") or name_lower.endswith(f"%r{ext}") or name_lower.endswith(f"_r{ext}"):
-                key = (
-                    name[: -len(ext)]
-                    .replace(".R", "")
-                    .replace(".r", "")
-                    .replace("%R", "")
-                    .replace("%r", "")
-                    .replace("_R", "")
-                    .replace("_r", "")
-                )
-                grouped.setdefault((key, ext), {})["R"] = path
+        lefts: dict[tuple[str, str], Path] = {}
+        rights: dict[tuple[str, str], Path] = {}
+        extensions = self._EXTENSIONS
+        match_pair = _PAIR_RE.match
+        with os.scandir(source) as entries:
+            for entry in entries:
+                match = match_pair(entry.name)
+                if match is None or not entry.is_file():
+                    continue
+                ext = match["ext"].lower()
+                if ext not in extensions:
+                    continue
+                side = rights if match["side"] in "Rr" else lefts
+                side[(match["key"], ext)] = Path(entry.path)
 
         pairs = []
-        for (key, ext), files in grouped.items():
-            left = files.get("L")
-            right = files.get("R")
-            if left and right:
-                pairs.append((key, left, right, ext))
+        for (key, ext), left in lefts.items():
+            right = rights.pop((key, ext), None)
+            if right is None:
+                self._log(f"Skipping {key}: missing L or R")
             else:
-                self.app.call_from_thread(
-                    self._log, f"Skipping {key}: missing L or R"
-                )
+                pairs.append((key, left, right, ext))
+        # Whatever is left over had no matching L file.
+        for key, _ in rights:
+            self._log(f"Skipping {key}: missing L or R")
         return pairs
 
-    def _merge_to_stereo(self, left_path: Path, right_path: Path, output_path: Path) -> None:
-        try:
-            from pydub import AudioSegment
-        except Exception as exc:
-            raise RuntimeError(f"pydub error: {exc}") from exc
-
-        left = AudioSegment.from_file(left_path)
-        right = AudioSegment.from_file(right_path)
-        if left.frame_rate != right.frame_rate or left.sample_width != right.sample_width:
-            raise ValueError("Input files differ in parameters.")
-        if len(left) != len(right):
-            raise ValueError("Input files differ in length.")
-
-        stereo = AudioSegment.from_mono_audiosegments(left, right)
-        file_format = output_path.suffix.lower().lstrip(".")
-        export_args = {}
-        if file_format == "mp3":
-            export_args = {"parameters": ["-q:a", "0"]}
-        stereo.export(output_path, format=file_format, **export_args)
-
     def _deps_ready(self) -> bool:
-        if importlib.util.find_spec("pydub") is None:
-            self.status.update("[red]Missing dependency: pydub.[/red]")
-            return False
-        if shutil.which("ffmpeg") is None:
-            self.status.update("[red]Missing dependency: ffmpeg.[/red]")
-            return False
+        for dependency in ("ffmpeg", "ffprobe"):
+            if shutil.which(dependency) is None:
+                self.status.update(f"[red]Missing dependency: {dependency}.[/red]")
+                return False
         return True
 
     def _log(self, text: str) -> None:
-        self._log_lines.append(text)
+        self._pending_logs.append(text)
+
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        batch: list[str] = []
+        while self._pending_logs:
+            batch.append(self._pending_logs.popleft())
+        text = "\n".join(batch)
+        if self._log_buffer.tell():
+            self._log_buffer.write("\n")
+        self._log_buffer.write(text)
         self.log_view.write(text)
 
     def _clear_log(self) -> None:
-        self._log_lines.clear()
+        self._pending_logs.clear()
+        self._log_buffer = io.StringIO()
         self.log_view.clear()
         self.status.update("")
         self.progress.update(progress=0, total=0)
 
     def _copy_log(self) -> None:
-        if not self._log_lines:
+        if not self._log_buffer.tell():
             self.status.update("[yellow]Log is empty.[/yellow]")
             return
-        self.app.copy_to_clipboard("\n".join(self._log_lines))
+        self.app.copy_to_clipboard(self._log_buffer.getvalue())
         self.status.update("[green]Log copied to clipboard.[/green]")
 
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import codecs
+import os
+import select
+import selectors
 import socket
-import socketserver
 import threading
 from dataclasses import dataclass
 
@@ -12,28 +15,94 @@ from textual.widgets import Button, Footer, Header, Input, Label, RichLog, Stati
 
 from toolbox.tools.base import Tool
 
+_RECV_BUFSIZE = 64 * 1024
+_SOCKET_RCVBUF = 256 * 1024
+_POLL_INTERVAL = 0.2
+_READ_BURST = 1024 * 1024
+
 
 @dataclass
 class _TcpServerState:
-    server: socketserver.ThreadingTCPServer | None = None
+    server: _TcpServer | None = None
     thread: threading.Thread | None = None
 
 
-class _TcpHandler(socketserver.BaseRequestHandler):
-    def handle(self) -> None:
-        server = self.server  # type: ignore[assignment]
-        app = getattr(server, "app", None)
-        if app is None:
-            return
-        data = self.request.recv(4096)
+# One selector loop on a single thread serves the listener and every connection.
+class _TcpServer:
+    def __init__(self, address: tuple[str, int], app) -> None:
+        self.app = app
+        self._stopped = threading.Event()
+        self._selector = selectors.DefaultSelector()
+        # Only the loop thread reads, so one buffer serves all connections.
+        self._buffer = memoryview(bytearray(_RECV_BUFSIZE))
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            text = data.decode("utf-8", errors="replace")
+            # Connections closed by stopping leave TIME_WAIT entries on this port.
+            if os.name != "nt":
+                self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_RCVBUF)
+            self._listener.bind(address)
+            self._listener.listen()
         except Exception:
-            text = repr(data)
-        app.call_from_thread(
-            getattr(app.screen, "_log", lambda *_: None),
-            f"{self.client_address[0]}:{self.client_address[1]} -> {text}",
-        )
+            self._listener.close()
+            raise
+        self._listener.setblocking(False)
+        self._selector.register(self._listener, selectors.EVENT_READ)
+
+    def serve_forever(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                for key, _ in self._selector.select(timeout=_POLL_INTERVAL):
+                    if key.data is None:
+                        self._accept()
+                    else:
+                        self._read(key)
+        finally:
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()
+            self._selector.close()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+
+    def _accept(self) -> None:
+        try:
+            conn, address = self._listener.accept()
+        except OSError:
+            return
+        conn.setblocking(False)
+        peer = f"{address[0]}:{address[1]}"
+        # Incremental so multi-byte characters split across reads still decode.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._selector.register(conn, selectors.EVENT_READ, (peer, decoder))
+
+    def _read(self, key: selectors.SelectorKey) -> None:
+        conn = key.fileobj
+        peer, decoder = key.data
+        # Drain what has arrived so a burst is decoded and logged once.
+        data = bytearray()
+        closed = False
+        while len(data) < _READ_BURST:
+            try:
+                count = conn.recv_into(self._buffer)
+            except BlockingIOError:
+                break
+            except OSError:
+                count = 0
+            if not count:
+                closed = True
+                break
+            data += self._buffer[:count]
+            if count < len(self._buffer):
+                break
+        text = decoder.decode(data, final=closed)
+        if text:
+            self.app.call_from_thread(
+                getattr(self.app.screen, "_log", lambda *_: None), f"{peer} -> {text}"
+            )
+        if closed:
+            self._selector.unregister(conn)
+            conn.close()
 
 
 class TcpToolScreen(Screen):
@@ -43,6 +112,8 @@ class TcpToolScreen(Screen):
         super().__init__()
         self._server_state = _TcpServerState()
         self._log_lines: list[str] = []
+        self._send_sockets: dict[tuple[str, int], socket.socket] = {}
+        self._last_encoded: tuple[str, bytes] | None = None
 
     def compose(self):
         yield Header()
@@ -77,10 +148,15 @@ class TcpToolScreen(Screen):
             with Horizontal(id="tcp-log-actions"):
                 yield Button("Copy Log", id="tcp-copy")
                 yield Button("Clear Log", id="tcp-clear")
-            self.log_view = RichLog(id="tcp-log", highlight=True)
+            self.log_view = RichLog(id="tcp-log", highlight=False)
             yield self.log_view
         yield Footer()
 
+    def on_unmount(self) -> None:
+        for sock in self._send_sockets.values():
+            sock.close()
+        self._send_sockets.clear()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "tcp-send":
             self._send_message()
@@ -110,13 +186,48 @@ class TcpToolScreen(Screen):
         except ValueError:
             self.status.update("[red]Port must be a number.[/red]")
             return
+        if self._last_encoded is not None and self._last_encoded[0] == message:
+            data = self._last_encoded[1]
+        else:
+            data = message.encode("utf-8")
+            self._last_encoded = (message, data)
         try:
-            with socket.create_connection((host, port), timeout=3) as sock:
-                sock.sendall(message.encode("utf-8"))
+            try:
+                self._socket_for(host, port).sendall(data)
+            except OSError:
+                # The cached connection went away between sends; reconnect once.
+                self._drop_socket(host, port)
+                self._socket_for(host, port).sendall(data)
             self.status.update("[green]Message sent.[/green]")
         except Exception as exc:
+            self._drop_socket(host, port)
             self.status.update(f"[red]Send failed: {exc}[/red]")
 
+    def _socket_for(self, host: str, port: int) -> socket.socket:
+        key = (host, port)
+        sock = self._send_sockets.get(key)
+        if sock is not None and not self._socket_open(sock):
+            self._drop_socket(host, port)
+            sock = None
+        if sock is None:
+            sock = socket.create_connection(key, timeout=3)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._send_sockets[key] = sock
+        return sock
+
+    def _drop_socket(self, host: str, port: int) -> None:
+        sock = self._send_sockets.pop((host, port), None)
+        if sock is not None:
+            sock.close()
+
+    def _socket_open(self, sock: socket.socket) -> bool:
+        # A readable socket with nothing to peek means the peer closed it.
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            return not readable or bool(sock.recv(1, socket.MSG_PEEK))
+        except OSError:
+            return False
+
     def _start_server(self) -> None:
         if self._server_state.server is not None:
             self.status.update("[yellow]Server already running.[/yellow]")
@@ -129,9 +240,7 @@ class TcpToolScreen(Screen):
             self.status.update("[red]Port must be a number.[/red]")
             return
         try:
-            server = socketserver.ThreadingTCPServer((host, port), _TcpHandler)
-            server.daemon_threads = True
-            server.app = self.app  # type: ignore[attr-defined]
+            server = _TcpServer((host, port), self.app)
             thread = threading.Thread(target=server.serve_forever, daemon=True)
             thread.start()
             self._server_state = _TcpServerState(server=server, thread=thread)
@@ -145,7 +254,8 @@ class TcpToolScreen(Screen):
             self.status.update("[yellow]Server is not running.[/yellow]")
             return
         server.shutdown()
-        server.server_close()
+        if self._server_state.thread is not None:
+            self._server_state.thread.join(timeout=1)
         self._server_state = _TcpServerState()
         self.status.update("[green]Server stopped.[/green]")
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+from functools import lru_cache
 import importlib.util
 import shutil
 from pathlib import Path
@@ -9,7 +11,6 @@ from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.screen import Screen
 from textual.widgets import (
     Button,
-    DirectoryTree,
     Footer,
     Header,
     Input,
@@ -19,9 +20,20 @@ from textual.widgets import (
     Static,
 )
 
+from toolbox.tools._picker import FolderPickerScreen
 from toolbox.tools.base import Tool
 
 
+@lru_cache(maxsize=1)
+def _has_yt_dlp() -> bool:
+    return importlib.util.find_spec("yt_dlp") is not None
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path() -> str | None:
+    return shutil.which("ffmpeg")
+
+
 class YouTubeDownloaderScreen(Screen):
     BINDINGS = [Binding("escape", "back", "Back", priority=True)]
 
@@ -37,6 +49,8 @@ class YouTubeDownloaderScreen(Screen):
         ("Best Audio", "bestaudio"),
         ("Worst Audio", "worstaudio"),
     ]
+    _LOG_FLUSH_INTERVAL = 0.05
+
     def compose(self):
         yield Header()
         with ScrollableContainer(id="yt-form"):
@@ -72,13 +86,27 @@ class YouTubeDownloaderScreen(Screen):
                 yield Button("Clear Log", id="yt-clear")
             self.status = Static("", id="yt-status")
             yield self.status
-            self.log_view = RichLog(id="yt-log", highlight=True)
+            self.log_view = RichLog(id="yt-log", highlight=False)
             yield self.log_view
         yield Footer()
 
     def __init__(self) -> None:
         super().__init__()
         self._log_lines: list[str] = []
+        # yt-dlp logs from the worker thread; a timer drains this into the RichLog.
+        self._pending_logs: deque[str] = deque()
+
+    def on_mount(self) -> None:
+        self.set_interval(self._LOG_FLUSH_INTERVAL, self._flush_logs)
+        if _has_yt_dlp():
+            self.run_worker(self._preload_yt_dlp, thread=True)
+
+    def _preload_yt_dlp(self) -> None:
+        # Importing yt-dlp pulls in hundreds of extractors; warm it before Download.
+        try:
+            import yt_dlp  # noqa: F401
+        except Exception:
+            pass
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "yt-mode":
@@ -103,10 +131,13 @@ class YouTubeDownloaderScreen(Screen):
             self._start_download()
 
     def _start_download(self) -> None:
-        if importlib.util.find_spec("yt_dlp") is None:
+        # Misses aren't cached; the dependency may be installed while the app runs.
+        if not _has_yt_dlp():
+            _has_yt_dlp.cache_clear()
             self.status.update("[red]Missing dependency: yt-dlp. Run 'pip install -e .'[/red]")
             return
-        if self.mode_select.value == "audio" and shutil.which("ffmpeg") is None:
+        if self.mode_select.value == "audio" and _ffmpeg_path() is None:
+            _ffmpeg_path.cache_clear()
             self.status.update("[red]Missing dependency: ffmpeg (required for audio).[/red]")
             return
         url = self.url_input.value.strip()
@@ -189,7 +220,7 @@ class YouTubeDownloaderScreen(Screen):
             self.output_input.value = str(path)
 
         self.app.push_screen(
-            PathPickerScreen(
+            FolderPickerScreen(
                 on_selected=_apply,
                 start_path=start_path,
                 title="Select output folder",
@@ -197,10 +228,19 @@ class YouTubeDownloaderScreen(Screen):
         )
 
     def _log(self, text: str) -> None:
-        self._log_lines.append(text)
-        self.log_view.write(text)
+        self._pending_logs.append(text)
+
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        batch: list[str] = []
+        while self._pending_logs:
+            batch.append(self._pending_logs.popleft())
+        self._log_lines.extend(batch)
+        self.log_view.write("\n".join(batch))
 
     def _clear_log(self) -> None:
+        self._pending_logs.clear()
         self._log_lines.clear()
         self.log_view.clear()
         self.status.update("")
@@ -218,12 +258,10 @@ class YouTubeDownloaderScreen(Screen):
             percent = data.get("_percent_str", "").strip()
             speed = data.get("_speed_str", "").strip()
             eta = data.get("_eta_str", "").strip()
-            self.app.call_from_thread(
-                self._log, f"Downloading {percent} {speed} ETA {eta}".strip()
-            )
+            self._log(f"Downloading {percent} {speed} ETA {eta}".strip())
         elif status == "finished":
             filename = data.get("filename", "download")
-            self.app.call_from_thread(self._log, f"Finished: {filename}")
+            self._log(f"Finished: {filename}")
 
 
 class _YtLogger:
@@ -231,49 +269,16 @@ class _YtLogger:
         self._screen = screen
 
     def debug(self, msg: str) -> None:
-        self._screen.app.call_from_thread(self._screen._log, msg)
+        self._screen._log(msg)
 
     def info(self, msg: str) -> None:
-        self._screen.app.call_from_thread(self._screen._log, msg)
+        self._screen._log(msg)
 
     def warning(self, msg: str) -> None:
-        self._screen.app.call_from_thread(self._screen._log, f"WARNING: {msg}")
+        self._screen._log(f"WARNING: {msg}")
 
     def error(self, msg: str) -> None:
-        self._screen.app.call_from_thread(self._screen._log, f"ERROR: {msg}")
-
-
-class PathPickerScreen(Screen):
-    BINDINGS = [Binding("escape", "back", "Cancel", priority=True)]
-
-    def __init__(
-        self,
-        *,
-        on_selected,
-        start_path: Path | None = None,
-        title: str = "Select folder",
-    ) -> None:
-        super().__init__()
-        self._on_selected = on_selected
-        self._start_path = start_path or Path.home()
-        self._title = title
-
-    def compose(self):
-        yield Header()
-        yield Static(self._title, id="yt-picker-title")
-        yield FilteredDirectoryTree(self._start_path, id="yt-picker-tree")
-        yield Footer()
-
-    def on_directory_tree_directory_selected(
-        self, event: DirectoryTree.DirectorySelected
-    ) -> None:
-        self._on_selected(event.path)
-        self.app.pop_screen()
-
-
-class FilteredDirectoryTree(DirectoryTree):
-    def filter_paths(self, paths):
-        return [path for path in paths if not path.name.startswith(".")]
+        self._screen._log(f"ERROR: {msg}")
 
 
 TOOL = Tool(